@@ -2,12 +2,84 @@
 building extrusion from osm footprints
 creates 3d building meshes from 2d footprints
 """
+import os
+import math
 import trimesh
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Dict, Any, Optional
 from shapely.geometry import Polygon
 from app.utils.coords import CoordinateTransformer
 
+# numba is optional: the sampling kernel falls back to plain python without it
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# below this count the process pool spawn/pickle overhead outweighs the win
+PARALLEL_MIN_BUILDINGS = 64
+
+
+if HAS_NUMBA:
+    @njit(cache=True)
+    def _bilinear_height(heights, rows, cols, origin_x, origin_z,
+                         dx_per_col, dz_per_row, x, z):
+        """
+        jit-compiled bilinear terrain height lookup on the flattened grid
+        returns nan when (x, z) falls outside the grid
+        """
+        col_f = (x - origin_x) / dx_per_col
+        row_f = (z - origin_z) / dz_per_row
+
+        if col_f < 0.0 or col_f > cols - 1 or row_f < 0.0 or row_f > rows - 1:
+            return np.nan
+
+        c0 = min(int(col_f), cols - 2)
+        r0 = min(int(row_f), rows - 2)
+        u = col_f - c0
+        v = row_f - r0
+
+        idx00 = r0 * cols + c0
+        h00 = heights[idx00]
+        h10 = heights[idx00 + 1]
+        h01 = heights[idx00 + cols]
+        h11 = heights[idx00 + cols + 1]
+
+        h_top = h00 * (1 - u) + h10 * u
+        h_bot = h01 * (1 - u) + h11 * u
+        return h_top * (1 - v) + h_bot * v
+
+    # warm the jit cache at import so the first request doesn't pay compile time
+    _bilinear_height(np.zeros(4), 2, 2, 0.0, 0.0, 1.0, 1.0, 0.5, 0.5)
+
+
+def _extrude_chunk(
+    building_chunk: List[Dict[str, Any]],
+    center_lat: float,
+    center_lon: float,
+    grid_params: Optional[Dict[str, Any]],
+    min_height: float
+) -> List[Optional[trimesh.Trimesh]]:
+    """
+    worker for parallel extrusion
+
+    rebuilds a lightweight extruder from the center coords and the plain
+    numpy grid params, so the terrain mesh itself is never pickled
+    """
+    extruder = BuildingExtruder(center_lat, center_lon)
+    extruder.grid_params = grid_params
+
+    meshes = []
+    for building in building_chunk:
+        try:
+            meshes.append(extruder._extrude_single_building(building, min_height))
+        except Exception as e:
+            print(f"Error processing building {building.get('id')}: {e}")
+            meshes.append(None)
+    return meshes
+
 
 class BuildingExtruder:
     """
@@ -24,6 +96,8 @@ class BuildingExtruder:
             center_lon: center longitude for coordinate transformation
             terrain_mesh: optional terrain mesh to sample elevation from
         """
+        self.center_lat = center_lat
+        self.center_lon = center_lon
         self.transformer = CoordinateTransformer(center_lat, center_lon)
         self.terrain_mesh = terrain_mesh
         
@@ -69,7 +143,9 @@ class BuildingExtruder:
             'dz_per_row': dz_per_row,
             'rows': rows,
             'cols': cols,
-            'vertices': vertices
+            'vertices': vertices,
+            # contiguous heights column for the jitted sampling kernel
+            'heights': np.ascontiguousarray(vertices[:, 1], dtype=np.float64)
         }
     
     def extrude_buildings(
@@ -79,10 +155,20 @@ class BuildingExtruder:
     ) -> List[trimesh.Trimesh]:
         """
         extrude building footprints to 3d meshes
-        
+
+        footprints are independent, so large batches are split across a
+        process pool (one chunk per core) to get past the GIL
+
         returns list of meshes with same length as building_data,
         with None for buildings that failed to extrude
         """
+        workers = os.cpu_count() or 1
+        if len(building_data) >= PARALLEL_MIN_BUILDINGS and workers > 1:
+            try:
+                return self._extrude_parallel(building_data, min_height, workers)
+            except Exception as e:
+                print(f"Parallel extrusion failed ({e}), falling back to serial")
+
         meshes = []
         stats = {
             "total": len(building_data),
@@ -105,7 +191,45 @@ class BuildingExtruder:
                 stats["failed"] += 1
         
         return meshes
-    
+
+    def _extrude_parallel(
+        self,
+        building_data: List[Dict[str, Any]],
+        min_height: float,
+        workers: int
+    ) -> List[trimesh.Trimesh]:
+        """
+        extrude buildings across a process pool, one chunk per worker
+        """
+        # plain numpy copy of the grid params so workers don't pickle the mesh;
+        # sampling only reads the flat heights array, so the full vertex
+        # array stays out of the worker payload too
+        grid_params = None
+        if self.grid_params:
+            grid_params = dict(self.grid_params)
+            grid_params.pop('vertices', None)
+            grid_params['heights'] = np.asarray(grid_params['heights'])
+
+        chunk_size = math.ceil(len(building_data) / workers)
+        chunks = [
+            building_data[i:i + chunk_size]
+            for i in range(0, len(building_data), chunk_size)
+        ]
+
+        meshes = []
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(
+                    _extrude_chunk,
+                    chunk, self.center_lat, self.center_lon, grid_params, min_height
+                )
+                for chunk in chunks
+            ]
+            for future in futures:
+                meshes.extend(future.result())
+
+        return meshes
+
     def _extrude_single_building(
         self,
         building: Dict[str, Any],
@@ -155,7 +279,8 @@ class BuildingExtruder:
         # 4. Sample Terrain Ground Height
         # We need the building base to sit on the terrain
         base_elevation = 0.0
-        if self.terrain_mesh is not None:
+        # grid_params may be set without a mesh (parallel workers get only the arrays)
+        if self.terrain_mesh is not None or self.grid_params:
             # Pass simple x, z centroid
             cx, cz = np.mean(xs), np.mean(zs)
             elevation = self._sample_terrain_elevation(cx, cz)
@@ -217,7 +342,16 @@ class BuildingExtruder:
         # Try O(1) Grid Lookup
         if self.grid_params:
             p = self.grid_params
-            
+
+            if HAS_NUMBA and 'heights' in p:
+                h = _bilinear_height(
+                    p['heights'], p['rows'], p['cols'],
+                    p['origin_x'], p['origin_z'],
+                    p['dx_per_col'], p['dz_per_row'],
+                    x, z
+                )
+                return None if np.isnan(h) else float(h)
+
             col_f = (x - p['origin_x']) / p['dx_per_col']
             row_f = (z - p['origin_z']) / p['dz_per_row']
             
@@ -237,11 +371,14 @@ class BuildingExtruder:
                 idx10 = idx00 + 1
                 idx01 = (r0 + 1) * cols + c0
                 idx11 = idx01 + 1
-                
-                h00 = p['vertices'][idx00, 1]
-                h10 = p['vertices'][idx10, 1]
-                h01 = p['vertices'][idx01, 1]
-                h11 = p['vertices'][idx11, 1]
+
+                # read from the contiguous heights array (same buffer the
+                # numba path samples) instead of strided AoS vertex rows
+                heights = p['heights']
+                h00 = heights[idx00]
+                h10 = heights[idx10]
+                h01 = heights[idx01]
+                h11 = heights[idx11]
                 
                 h_top = h00 * (1-u) + h10 * u
                 h_bot = h01 * (1-u) + h11 * u
@@ -275,8 +412,6 @@ class BuildingExtruder:
         # trimesh stores face_normals: (N, 3). vertices: (3N, 3) (if exploded)
         # Actually simplest way: use vertex normals if valid, or just based on position
         
-        uvs = np.zeros((len(vertices), 2))
-        
         # Box Projection Logic
         # n = normal
         # if n approx (0, 1, 0) or (0, -1, 0) -> Roof/Floor -> Use XZ
@@ -301,8 +436,9 @@ class BuildingExtruder:
         # Roofs AND Walls: Map to (0,0) -> The "Grey Swatch" corner
         # This makes all buildings solid grey (cleaner bird's eye view)
         # We paint a small grey square at 0,0 of the texture
-        uvs[:, 0] = 0.005  # Small offset to hit the pixel center
-        uvs[:, 1] = 0.005
+        # (single fill instead of zeros + two column writes; the small
+        # offset hits the pixel center)
+        uvs = np.full((len(vertices), 2), 0.005, dtype=np.float32)
         
         mesh.visual = trimesh.visual.TextureVisuals(uv=uvs)
 
@@ -7,8 +7,11 @@ import numpy as np
 from PIL import Image
 from io import BytesIO
 from typing import Tuple, List
+from concurrent.futures import ThreadPoolExecutor
 import math
-from scipy.ndimage import gaussian_filter
+import os
+import tempfile
+from scipy.ndimage import convolve1d
 
 
 class MapboxTerrainFetcher:
@@ -27,7 +30,33 @@ class MapboxTerrainFetcher:
         self.access_token = access_token
         self.base_url = "https://api.mapbox.com/v4/mapbox.terrain-rgb"
         self.tile_size = 512  # mapbox tiles are 512x512 pixels
+        # persistent session: keep-alive avoids a tls handshake per tile;
+        # the pool is sized so parallel tile workers don't queue waiting
+        # for a free connection
+        self.session = requests.Session()
+        self.session.mount(
+            "https://",
+            requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        )
         self.smoothing_sigma = smoothing_sigma
+        # terrain tiles are immutable, so cache them on disk without a ttl
+        self.tile_cache_dir = os.path.join(tempfile.gettempdir(), "tark_cache", "terrain_tiles")
+        # precompute the separable smoothing kernel once; sigma is fixed per fetcher
+        self._smoothing_kernel = self._build_gaussian_kernel(smoothing_sigma)
+
+    @staticmethod
+    def _build_gaussian_kernel(sigma: float) -> np.ndarray:
+        """
+        build a truncated, normalized 1d gaussian kernel for the given sigma
+        (same 4-sigma truncation as scipy's gaussian_filter default)
+        """
+        if sigma <= 0:
+            return None
+        radius = int(4.0 * sigma + 0.5)
+        x = np.arange(-radius, radius + 1, dtype=np.float32)
+        kernel = np.exp(-(x * x) / (2.0 * sigma * sigma))
+        kernel /= kernel.sum()
+        return kernel
     
     def fetch_elevation(
         self,
@@ -58,14 +87,28 @@ class MapboxTerrainFetcher:
         min_tile_x, min_tile_y = self._lat_lon_to_tile(north, west, zoom)
         max_tile_x, max_tile_y = self._lat_lon_to_tile(south, east, zoom)
         
-        # 2. fetch all tiles that cover the bounding box
+        # 2. fetch all tiles that cover the bounding box; downloads are
+        # i/o bound, so a small thread pool overlaps their latency while
+        # the session's keep-alive connections are shared across workers
+        xs = range(min_tile_x, max_tile_x + 1)
+        ys = range(min_tile_y, max_tile_y + 1)
+        coords = [(tx, ty) for ty in ys for tx in xs]
+
+        if len(coords) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(coords))) as pool:
+                images = pool.map(lambda c: self._fetch_tile(zoom, c[0], c[1]), coords)
+                fetched = dict(zip(coords, images))
+        else:
+            fetched = {coords[0]: self._fetch_tile(zoom, *coords[0])}
+
+        # reassemble in grid order (parallelism must not reorder rows)
         tiles = []
         tile_positions = []
-        
-        for ty in range(min_tile_y, max_tile_y + 1):
+
+        for ty in ys:
             row = []
-            for tx in range(min_tile_x, max_tile_x + 1):
-                tile_img = self._fetch_tile(zoom, tx, ty)
+            for tx in xs:
+                tile_img = fetched[(tx, ty)]
                 if tile_img:
                     row.append(tile_img)
                     tile_positions.append((tx, ty))
@@ -136,17 +179,35 @@ class MapboxTerrainFetcher:
         returns:
             pil image of the tile
         """
+        # check the tile cache first
+        cache_path = os.path.join(self.tile_cache_dir, f"{zoom}_{x}_{y}.png")
+        if os.path.exists(cache_path):
+            try:
+                return Image.open(cache_path)
+            except OSError:
+                pass  # corrupt cache entry, refetch
+
         url = f"{self.base_url}/{zoom}/{x}/{y}.pngraw"
         params = {"access_token": self.access_token}
-        
+
         try:
-            response = requests.get(url, params=params, timeout=10)
+            response = self.session.get(url, params=params, timeout=10)
             response.raise_for_status()
-            
+
+            # cache raw tile bytes atomically for future requests
+            try:
+                os.makedirs(self.tile_cache_dir, exist_ok=True)
+                tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(response.content)
+                os.replace(tmp_path, cache_path)
+            except OSError as cache_err:
+                print(f"Warning: failed to cache tile {zoom}/{x}/{y}: {cache_err}")
+
             # load image from response
             image = Image.open(BytesIO(response.content))
             return image
-            
+
         except requests.exceptions.RequestException as e:
             print(f"Warning: Failed to fetch tile {zoom}/{x}/{y}: {e}")
             return None
@@ -248,12 +309,13 @@ class MapboxTerrainFetcher:
         returns:
             smoothed elevation array
         """
-        # apply gaussian filter
+        # separable convolution with the kernel precomputed at init
         # sigma controls smoothing strength:
         #   0.5-1.0 = light smoothing (removes noise, preserves features)
         #   1.0-2.0 = medium smoothing (good for urban/suburban areas)
         #   2.0-5.0 = heavy smoothing (flattens terrain significantly)
-        smoothed = gaussian_filter(elevation, sigma=self.smoothing_sigma, mode='reflect')
-        
+        smoothed = convolve1d(elevation, self._smoothing_kernel, axis=0, mode='reflect')
+        smoothed = convolve1d(smoothed, self._smoothing_kernel, axis=1, mode='reflect')
+
         return smoothed
 
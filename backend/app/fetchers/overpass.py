@@ -6,6 +6,10 @@ import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 from typing import List, Dict, Any, Optional
+import hashlib
+import json
+import os
+import tempfile
 import time
 
 
@@ -13,17 +17,21 @@ class OverpassFetcher:
     """
     fetches osm data via overpass api
     """
-    
-    def __init__(self, timeout: int = 45):
+
+    def __init__(self, timeout: int = 45, cache_ttl: float = 24 * 3600):
         """
         initialize overpass fetcher
-        
+
         args:
             timeout: query timeout in seconds
+            cache_ttl: how long cached responses stay valid, in seconds
+                (0 disables the cache)
         """
         self.base_url = "https://overpass-api.de/api/interpreter"
         self.timeout = timeout
-        
+        self.cache_ttl = cache_ttl
+        self.cache_dir = os.path.join(tempfile.gettempdir(), "tark_cache", "overpass")
+
         # configure retry strategy
         self.session = requests.Session()
         retries = Retry(
@@ -33,6 +41,36 @@ class OverpassFetcher:
             allowed_methods=["POST"]
         )
         self.session.mount("https://", HTTPAdapter(max_retries=retries))
+
+    def _cache_path(self, north: float, south: float, east: float, west: float) -> str:
+        """cache file path for a bbox query"""
+        key = hashlib.sha1(f"{north},{south},{east},{west}".encode()).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _cache_get(self, path: str) -> Optional[Dict[str, Any]]:
+        """return cached response data if present and fresh, else none"""
+        if self.cache_ttl <= 0:
+            return None
+        try:
+            if time.time() - os.path.getmtime(path) > self.cache_ttl:
+                return None
+            with open(path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _cache_put(self, path: str, data: Dict[str, Any]):
+        """write response data atomically so readers never see partial files"""
+        if self.cache_ttl <= 0:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Warning: failed to write overpass cache: {e}")
     
     def fetch_buildings(
         self,
@@ -53,9 +91,16 @@ class OverpassFetcher:
         returns:
             list of building dictionaries with footprints and metadata
         """
+        # 0. check the on-disk cache (overpass queries take seconds and the
+        # same bbox is often re-requested during iteration)
+        cache_path = self._cache_path(north, south, east, west)
+        cached = self._cache_get(cache_path)
+        if cached is not None:
+            return self._parse_response(cached)
+
         # 1. build query
         query = self._build_query(north, south, east, west)
-        
+
         # 2. send request
         try:
             # add user-agent header (good practice for osm)
@@ -87,9 +132,10 @@ class OverpassFetcher:
             except requests.exceptions.RequestException as e2:
                 raise Exception(f"Overpass API request failed (main and backup): {e2}")
         
-        # 3. parse response
+        # 3. cache the raw response, then parse
+        self._cache_put(cache_path, data)
         buildings = self._parse_response(data)
-        
+
         return buildings
     
     def _build_query(self, north: float, south: float, east: float, west: float) -> str:
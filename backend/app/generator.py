@@ -3,9 +3,11 @@ main mesh generation pipeline
 orchestrates the entire process from bbox to 3d mesh
 """
 from typing import Tuple, Optional, List, Callable
+import logging
 import os
 import math
 import time
+from concurrent.futures import ThreadPoolExecutor
 import trimesh
 import numpy as np
 from PIL import Image
@@ -17,6 +19,8 @@ from app.buildings import BuildingExtruder
 from app.textures import MapboxSatelliteFetcher
 from app.utils.mesh import merge_meshes, export_obj
 
+logger = logging.getLogger(__name__)
+
 
 class MeshGenerator:
     """
@@ -27,6 +31,17 @@ class MeshGenerator:
         self.temp_dir = temp_dir
         self.mapbox_token = mapbox_token
         os.makedirs(temp_dir, exist_ok=True)
+
+        # fetchers are created once so their http sessions (keep-alive,
+        # tls) persist across generate() calls
+        self.terrain_fetcher = MapboxTerrainFetcher(mapbox_token, smoothing_sigma=5)
+        self.satellite_fetcher = MapboxSatelliteFetcher(mapbox_token)
+        self.overpass_fetcher = OverpassFetcher()
+
+        # pool for overlapping the texture save and scene export with the
+        # rest of the pipeline; futures (unlike bare threads) re-raise
+        # worker exceptions at the .result() call
+        self._io_pool = ThreadPoolExecutor(max_workers=2)
     
     def generate(
         self,
@@ -39,13 +54,18 @@ class MeshGenerator:
         zoom_level: int = 12,
         texture_max_dimension: int = 1280,
         progress_callback: Optional[Callable[[int, str], None]] = None,
-        debug: bool = False
+        debug: bool = False,
+        file_format: str = "obj",
+        output_dir: Optional[str] = None
     ) -> Tuple[str, Optional[str], List[str]]:
-        
+
+        # per-job output dir lets one generator instance (and its http
+        # sessions) serve many jobs without their files colliding
+        out_dir = output_dir or self.temp_dir
+        os.makedirs(out_dir, exist_ok=True)
+
         start_time = time.time()
-        print("\n" + "="*60)
-        print("mesh generation pipeline")
-        print("="*60)
+        logger.info("mesh generation pipeline started")
         
         if progress_callback:
             progress_callback(0, "starting generation...")
@@ -59,11 +79,10 @@ class MeshGenerator:
         # ---------------------------------------------------------
         # 1. GENERATE TERRAIN
         # ---------------------------------------------------------
-        print("[1/5] fetching elevation & building terrain...")
+        logger.info("[1/5] fetching elevation & building terrain...")
         if progress_callback: progress_callback(10, "building terrain...")
         
-        mapbox_fetcher = MapboxTerrainFetcher(self.mapbox_token, smoothing_sigma=5)
-        elevation_data, _ = mapbox_fetcher.fetch_elevation(
+        elevation_data, _ = self.terrain_fetcher.fetch_elevation(
             north=north, south=south, east=east, west=west, zoom=zoom_level
         )
         
@@ -76,22 +95,22 @@ class MeshGenerator:
             generate_uvs=include_textures
         )
         
-        print(f"  terrain: {len(terrain_mesh.vertices)} vertices")
+        logger.info("terrain: %d vertices", len(terrain_mesh.vertices))
         
         if debug:
-            print("  [debug] exporting terrain_only.obj")
-            export_obj(terrain_mesh, os.path.join(self.temp_dir, "debug_terrain_only"))
+            logger.info("[debug] exporting terrain_only.obj")
+            export_obj(terrain_mesh, os.path.join(out_dir, "debug_terrain_only"))
         
         # ---------------------------------------------------------
         # 2. FETCH & APPLY SATELLITE TEXTURE
         # ---------------------------------------------------------
         terrain_texture_path = None
+        terrain_texture_img = None
+        texture_save_future = None
         if include_textures:
-            print("[2/5] fetching satellite imagery...")
+            logger.info("[2/5] fetching satellite imagery...")
             if progress_callback: progress_callback(30, "fetching imagery...")
             
-            sat_fetcher = MapboxSatelliteFetcher(self.mapbox_token)
-            
             # Aspect Ratio Calculation for minimal distortion
             lat_dist = north - south
             lon_dist = east - west
@@ -107,43 +126,48 @@ class MeshGenerator:
                 height = texture_max_dimension
                 width = int(texture_max_dimension * aspect)
                 
-            tex_path = os.path.join(self.temp_dir, "terrain_texture.png")
-            
+            tex_path = os.path.join(out_dir, "terrain_texture.png")
+
             try:
-                _, saved_path = sat_fetcher.fetch_satellite_image(
-                    north, south, east, west, width, height, tex_path
+                # Fetch without saving: we still have to paint the swatch, so
+                # saving here would mean a second full PNG encode later.
+                img, _ = self.satellite_fetcher.fetch_satellite_image(
+                    north, south, east, west, width, height
                 )
-                if saved_path:
-                    texture_files.append(saved_path)
-                    terrain_texture_path = saved_path
-                    
-                    # Apply to generic visual for now (will be baked into material on export)
-                    # Terrain UVs are 0-1, image is WxH
-                    img = Image.open(saved_path)
-                    
+                if img:
+                    if img.mode not in ("RGB", "RGBA"):
+                        img = img.convert("RGB")
+
                     # MODIFY IMAGE: Add Grey Swatch for Walls
                     # We map walls to UV (0,0) which is Bottom-Left in standard UV space.
-                    # Pillow Image (0,0) is Top-Left. (0, H) is Bottom-Left.
-                    # So we paint a rectangle at (0, Height-32) to (32, Height).
-                    from PIL import ImageDraw
-                    draw = ImageDraw.Draw(img)
+                    # Pillow Image (0,0) is Top-Left, so the swatch goes in the
+                    # bottom-left corner of the pixel array: rows [-32:], cols [:32].
+                    # A direct numpy slice write avoids ImageDraw overhead.
                     swatch_size = 32
-                    w, h = img.size
-                    # Concrete Grey (128, 128, 128)
-                    draw.rectangle(
-                        [0, h - swatch_size, swatch_size, h],
-                        fill=(140, 140, 140) 
+                    arr = np.asarray(img).copy()
+                    # Concrete Grey (140, 140, 140)
+                    grey = (140, 140, 140, 255) if arr.shape[2] == 4 else (140, 140, 140)
+                    arr[-swatch_size:, :swatch_size] = grey
+                    img = Image.fromarray(arr)
+
+                    # Save the swatched texture for the zip in the background
+                    # (low compression: PNG encode at 1280^2 is otherwise hundreds of ms).
+                    # Resolved before generate() returns.
+                    texture_save_future = self._io_pool.submit(
+                        img.save, tex_path,
+                        format="PNG", optimize=False, compress_level=1
                     )
-                    # Save modified image (overwrite or new?)
-                    # Overwrite is fine as we only use it for this model
-                    img.save(saved_path)
-                    
+
+                    texture_files.append(tex_path)
+                    terrain_texture_path = tex_path
+                    terrain_texture_img = img
+
                     terrain_mesh.visual = trimesh.visual.TextureVisuals(
                         uv=terrain_mesh.visual.uv,
                         image=img
                     )
             except Exception as e:
-                print(f"  \033[33mwarning:\033[0m failed to fetch texture: {e}")
+                logger.warning("failed to fetch texture: %s", e)
 
         # ---------------------------------------------------------
         # 3. BUILDINGS
@@ -151,13 +175,12 @@ class MeshGenerator:
         meshes_to_merge = [terrain_mesh]
         
         if include_buildings:
-            print("[3/5] fetching & extruding buildings...")
+            logger.info("[3/5] fetching & extruding buildings...")
             if progress_callback: progress_callback(50, "processing buildings...")
             
-            overpass = OverpassFetcher()
-            buildings_data = overpass.fetch_buildings(north, south, east, west)
+            buildings_data = self.overpass_fetcher.fetch_buildings(north, south, east, west)
             
-            print(f"  found {len(buildings_data)} footprints")
+            logger.info("found %d footprints", len(buildings_data))
             
             if buildings_data:
                 # Initialize Extruder with SAME center
@@ -167,21 +190,21 @@ class MeshGenerator:
                 # filter out None values (failed buildings)
                 valid_building_meshes = [m for m in building_meshes if m is not None]
                 
-                print(f"  generated {len(valid_building_meshes)} buildings")
+                logger.info("generated %d buildings", len(valid_building_meshes))
                 
                 if debug and valid_building_meshes:
-                    print(f"  [debug] exporting {len(valid_building_meshes)} buildings to debug_buildings_only.obj")
+                    logger.info("[debug] exporting %d buildings to debug_buildings_only.obj", len(valid_building_meshes))
                     # Temporarily merge just buildings for debug export
                     # We accept the cost of an extra merge for debugging safety
-                    debug_buildings = trimesh.util.concatenate(valid_building_meshes)
-                    export_obj(debug_buildings, os.path.join(self.temp_dir, "debug_buildings_only"))
+                    debug_buildings = merge_meshes(valid_building_meshes)
+                    export_obj(debug_buildings, os.path.join(out_dir, "debug_buildings_only"))
 
                 meshes_to_merge.extend(valid_building_meshes)
         
         # ---------------------------------------------------------
         # 4. PREPARE SCENE
         # ---------------------------------------------------------
-        print("[4/5] preparing scene...")
+        logger.info("[4/5] preparing scene...")
         if progress_callback: progress_callback(80, "preparing scene...")
         
         scene = trimesh.Scene()
@@ -202,15 +225,35 @@ class MeshGenerator:
                 
                 building_list = meshes_to_merge[1:]
                 if building_list:
-                    print(f"  merging {len(building_list)} buildings...")
-                    combined_buildings = trimesh.util.concatenate(building_list)
+                    logger.info("merging %d buildings...", len(building_list))
+                    # no dedupe here: building meshes are deliberately
+                    # exploded to flat faces for hard edges (see
+                    # _apply_uv_mapping), and their uvs are all the same
+                    # swatch coordinate, so welding would fuse corner
+                    # vertices and smooth-shade the walls
+                    combined_buildings = merge_meshes(building_list)
                     
-                    if terrain_texture_path and include_textures:
-                         # Assign the SHARED Texture (with Grey Swatch)
-                         combined_buildings.visual = trimesh.visual.TextureVisuals(
-                            uv=combined_buildings.visual.uv, # Preserves the UVs we calculated in buildings.py
-                            image=Image.open(terrain_texture_path)
-                         )
+                    if terrain_texture_img is not None and include_textures:
+                        # Assign the SHARED Texture (with Grey Swatch)
+                        # merge_meshes preserves the UVs we calculated in
+                        # buildings.py, so on the happy path just attach the
+                        # in-memory image to the existing visual instead of
+                        # re-wrapping the uv array.
+                        visual = combined_buildings.visual
+                        if (isinstance(visual, trimesh.visual.TextureVisuals)
+                                and visual.uv is not None
+                                and len(visual.uv) == len(combined_buildings.vertices)):
+                            visual.material = trimesh.visual.material.SimpleMaterial(
+                                image=terrain_texture_img
+                            )
+                        else:
+                            # uvs didn't survive the merge: rebuild the visual
+                            # (loud so merge_meshes regressions don't hide here)
+                            logger.warning("building uvs lost in merge, rebuilding visual")
+                            combined_buildings.visual = trimesh.visual.TextureVisuals(
+                                uv=getattr(visual, 'uv', None),
+                                image=terrain_texture_img
+                            )
                     else:
                         # Fallback to Grey Color if no texture
                         combined_buildings.visual.material = trimesh.visual.material.SimpleMaterial(
@@ -222,27 +265,44 @@ class MeshGenerator:
         # ---------------------------------------------------------
         # 5. EXPORT
         # ---------------------------------------------------------
-        print("[5/5] exporting scene...")
+        logger.info("[5/5] exporting scene...")
         if progress_callback: progress_callback(90, "exporting...")
         
         # Texture Handling
         # If terrain has a texture image, ensure it survives export.
         # Trimesh Scene export handles this better than explicit merge.
         
-        output_path = os.path.join(self.temp_dir, "scene.obj")
-        
-        # Export
-        # Trimesh export_scene_obj returns bytes or string depending on params?
+        # glb writes vertex buffers as raw binary blobs (numpy tobytes), so it
+        # skips the per-float ASCII formatting that dominates OBJ export time
+        # and embeds the texture in the container.
+        if file_format == "glb":
+            output_path = os.path.join(out_dir, "scene.glb")
+            export_kwargs = {"file_type": "glb"}
+        else:
+            output_path = os.path.join(out_dir, "scene.obj")
+            export_kwargs = {"file_type": "obj", "include_normals": True}
+
+        # Export on a worker thread so serialization overlaps with the texture
+        # write instead of stacking on top of it.
         # The export() method on scene dispatches based on file extension.
-        scene.export(output_path, file_type='obj', include_normals=True)
-        
+        export_future = self._io_pool.submit(scene.export, output_path, **export_kwargs)
+
+        # Make sure the swatched texture has finished writing before the caller
+        # zips it; .result() re-raises any save/export failure with its
+        # original traceback instead of swallowing it on the worker thread
+        if texture_save_future is not None:
+            texture_save_future.result()
+
+        export_future.result()
+
         obj_path = output_path
+
+        mtl_path = None
+        if file_format != "glb":
+            mtl_path = obj_path.replace(".obj", ".mtl")
+            if not os.path.exists(mtl_path): mtl_path = None
         
-        mtl_path = obj_path.replace(".obj", ".mtl")
-        if not os.path.exists(mtl_path): mtl_path = None
-        
-        print(f"\n\033[32mgeneration complete\033[0m")
-        print(f"files: {os.path.basename(obj_path)}")
+        logger.info("generation complete in %.1fs: %s", time.time() - start_time, os.path.basename(obj_path))
         
         if progress_callback: progress_callback(100, "Done")
         
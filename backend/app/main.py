@@ -2,28 +2,55 @@
 tark backend - fastapi application
 generates game-ready 3d meshes from real-world locations
 """
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import FileResponse, ORJSONResponse, RedirectResponse
 from pydantic import BaseModel, Field
 from typing import Optional, Dict
 from enum import Enum
+import hashlib
+import logging
+import logging.handlers
 import os
-import math
+import queue
+import threading
+import time
 import zipfile
 import uuid
-import traceback
+from concurrent.futures import ThreadPoolExecutor
+from math import cos, radians
 from pathlib import Path
+from PIL import Image
 from dotenv import load_dotenv
 from app.generator import MeshGenerator
+from app.worker import celery_app
 
 # load environment variables from .env file
 load_dotenv()
 
+# read the token once at import so misconfiguration surfaces at boot,
+# not per request (the endpoint still 500s cleanly when it's missing)
+MAPBOX_TOKEN = os.getenv("MAPBOX_ACCESS_TOKEN")
+
+# route app logging through a queue so stdout writes happen on a background
+# thread instead of stalling the pipeline / event loop
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler())
+_log_listener.start()
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
+)
+logger = logging.getLogger(__name__)
+
 app = FastAPI(
     title="tark api",
     description="generate game-ready 3d meshes from real-world locations",
-    version="0.1.0"
+    version="0.1.0",
+    # orjson serializes responses in native code, faster than stdlib json
+    default_response_class=ORJSONResponse
 )
 
 # cors middleware for frontend integration
@@ -36,14 +63,165 @@ app.add_middleware(
     expose_headers=["Content-Disposition"],
 )
 
+# gzip larger text responses on the wire; level 1 keeps the cpu cost
+# negligible and browsers decompress transparently (the zip artifact is
+# already compressed, so clients shouldn't re-encode it)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=1)
+
 import tempfile
 
 # use system temp directory to avoid cluttering the project workspace
-TEMP_DIR = os.path.join(tempfile.gettempdir(), "tark_gen")
-os.makedirs(TEMP_DIR, exist_ok=True)
+TEMP_DIR = Path(tempfile.gettempdir()) / "tark_gen"
+TEMP_DIR.mkdir(parents=True, exist_ok=True)
+
+# one MeshGenerator per process: its fetchers hold persistent http sessions
+# whose keep-alive connections would otherwise be torn down after every job
+_generator: Optional[MeshGenerator] = None
+_generator_lock = threading.Lock()
+
+
+def get_generator(mapbox_token: str) -> MeshGenerator:
+    """get (lazily creating) the shared process-wide mesh generator"""
+    global _generator
+    with _generator_lock:
+        if _generator is None or _generator.mapbox_token != mapbox_token:
+            _generator = MeshGenerator(str(TEMP_DIR), mapbox_token)
+        return _generator
+
+# object storage is optional; with ARTIFACT_BUCKET set (and boto3
+# installed) finished zips are uploaded to s3 and /download redirects to
+# a presigned url, so the app server's disk never accumulates artifacts.
+# pair the bucket with a lifecycle rule (e.g. 24h expiry) for eviction.
+try:
+    import boto3
+    HAS_BOTO3 = True
+except ImportError:
+    HAS_BOTO3 = False
+
+ARTIFACT_BUCKET = os.getenv("ARTIFACT_BUCKET")
+s3_client = boto3.client("s3") if (HAS_BOTO3 and ARTIFACT_BUCKET) else None
+
+
+def artifact_object_key(zip_filename: str) -> str:
+    """bucket key for a finished artifact zip"""
+    return f"artifacts/{zip_filename}"
+
+
+# redis is optional; the in-memory store is used when it isn't configured
+try:
+    import redis
+    HAS_REDIS = True
+except ImportError:
+    HAS_REDIS = False
+
+
+class InMemoryProgressStore:
+    """
+    dict-backed job store for single-worker deployments
+
+    entries expire after TTL seconds and the store is capped, mirroring
+    the expiry the redis store gets for free — without it every job_id
+    ever submitted stays resident for the life of the process
+    """
+
+    TTL = 3600          # matches RedisProgressStore.TTL
+    MAX_ENTRIES = 10_000
+
+    def __init__(self):
+        # job_id -> (deadline, progress); dicts keep insertion order, so
+        # the first entry is always the oldest when we need to evict
+        self._store: Dict[str, tuple] = {}
+
+    def _evict(self):
+        """drop expired entries, then oldest ones if still over the cap"""
+        now = time.monotonic()
+        for job_id in [k for k, (deadline, _) in self._store.items() if deadline < now]:
+            del self._store[job_id]
+        while len(self._store) >= self.MAX_ENTRIES:
+            del self._store[next(iter(self._store))]
+
+    def __contains__(self, job_id: str) -> bool:
+        return self.get(job_id) is not None
+
+    def __getitem__(self, job_id: str) -> Dict[str, any]:
+        progress = self.get(job_id)
+        if progress is None:
+            raise KeyError(job_id)
+        return progress
+
+    def __setitem__(self, job_id: str, progress: Dict[str, any]):
+        if len(self._store) >= self.MAX_ENTRIES:
+            self._evict()
+        # re-insert so updated jobs move to the young end of the order
+        self._store.pop(job_id, None)
+        self._store[job_id] = (time.monotonic() + self.TTL, progress)
+
+    def get(self, job_id: str) -> Optional[Dict[str, any]]:
+        entry = self._store.get(job_id)
+        if entry is None:
+            return None
+        deadline, progress = entry
+        if deadline < time.monotonic():
+            del self._store[job_id]
+            return None
+        return progress
+
+
+class RedisProgressStore:
+    """
+    redis-hash-backed job store (job:{job_id}) so progress written by one
+    worker is visible to whichever worker answers /progress
+    """
+
+    TTL = 3600  # finished/stale jobs are reaped automatically
+
+    def __init__(self, url: str):
+        self._redis = redis.Redis.from_url(url, decode_responses=True)
 
-# in-memory progress store (use redis in production)
-progress_store: Dict[str, Dict[str, any]] = {}
+    @staticmethod
+    def _key(job_id: str) -> str:
+        return f"job:{job_id}"
+
+    def __contains__(self, job_id: str) -> bool:
+        return bool(self._redis.exists(self._key(job_id)))
+
+    def __getitem__(self, job_id: str) -> Dict[str, any]:
+        data = self.get(job_id)
+        if data is None:
+            raise KeyError(job_id)
+        return data
+
+    def get(self, job_id: str) -> Optional[Dict[str, any]]:
+        """single-round-trip lookup (hgetall returns {} for missing keys)"""
+        data = self._redis.hgetall(self._key(job_id))
+        if not data:
+            return None
+        if "percent" in data:
+            data["percent"] = int(data["percent"])
+        return data
+
+    def __setitem__(self, job_id: str, progress: Dict[str, any]):
+        key = self._key(job_id)
+        pipe = self._redis.pipeline()
+        pipe.delete(key)  # full replace, matching dict assignment semantics
+        pipe.hset(key, mapping=progress)
+        pipe.expire(key, self.TTL)
+        pipe.execute()
+
+
+# job progress store: redis when REDIS_URL is set (required for multi-worker),
+# otherwise in-process memory
+REDIS_URL = os.getenv("REDIS_URL")
+if REDIS_URL and HAS_REDIS:
+    progress_store = RedisProgressStore(REDIS_URL)
+else:
+    progress_store = InMemoryProgressStore()
+
+
+class ExportFormat(str, Enum):
+    """mesh file format options"""
+    OBJ = "obj"    # ascii, widest engine support (default)
+    GLB = "glb"    # binary gltf, much faster export, texture embedded
 
 
 class MeshQuality(str, Enum):
@@ -79,39 +257,48 @@ QUALITY_SETTINGS = {
 }
 
 
+# 1 degree of latitude approx 111km; see docs/logic/coordinates.md
+METERS_PER_DEG = 111000.0
+
+# area limits in meters (min prevents mapbox tile issues, max prevents timeouts)
+MIN_AREA_METERS = 1000.0
+MAX_AREA_METERS = 5000.0
+
+
 class BoundingBox(BaseModel):
     """geographic bounding box coordinates"""
     north: float = Field(..., ge=-90, le=90, description="north latitude")
     south: float = Field(..., ge=-90, le=90, description="south latitude")
     east: float = Field(..., ge=-180, le=180, description="east longitude")
     west: float = Field(..., ge=-180, le=180, description="west longitude")
-    
+
+    def dimensions_meters(self):
+        """approximate bbox dimensions in meters at the mid-latitude"""
+        center_lat = (self.north + self.south) / 2
+        # cos is non-negative for center_lat in [-90, 90], no abs needed
+        cos_lat = cos(radians(center_lat))
+        lat_meters = (self.north - self.south) * METERS_PER_DEG
+        lng_meters = (self.east - self.west) * METERS_PER_DEG * cos_lat
+        return lat_meters, lng_meters
+
     def validate_bbox(self):
         """validate bounding box constraints"""
         if self.north <= self.south:
             raise ValueError("north must be greater than south")
         if self.east <= self.west:
             raise ValueError("east must be greater than west")
-        
-        # calculate approximate dimensions in meters
-        # see docs/logic/coordinates.md for math details
-        lat_diff = self.north - self.south
-        lng_diff = self.east - self.west
-        
-        # at mid-latitude, convert degrees to meters
-        center_lat = (self.north + self.south) / 2
-        lat_meters = lat_diff * 111000  # 1 degree lat approx 111km
-        lng_meters = lng_diff * 111000 * abs(math.cos(math.radians(center_lat)))
-        
+
+        lat_meters, lng_meters = self.dimensions_meters()
+
         # minimum: 1km x 1km (prevents mapbox tile issues)
-        if lat_meters < 1000 or lng_meters < 1000:
+        if lat_meters < MIN_AREA_METERS or lng_meters < MIN_AREA_METERS:
             raise ValueError(
                 f"area too small: {lat_meters:.0f}m x {lng_meters:.0f}m. "
                 "minimum is 1km x 1km to ensure proper terrain representation."
             )
         
         # maximum: 5km x 5km (prevents timeout/memory issues)
-        if lat_meters > 5000 or lng_meters > 5000:
+        if lat_meters > MAX_AREA_METERS or lng_meters > MAX_AREA_METERS:
             raise ValueError(
                 f"area too large: {lat_meters:.0f}m x {lng_meters:.0f}m. "
                 "maximum is 5km x 5km."
@@ -132,12 +319,15 @@ async def root():
 
 @app.get("/health")
 async def health():
-    """detailed health check"""
-    return {
-        "status": "healthy",
-        "temp_dir": os.path.exists(TEMP_DIR),
-        "temp_dir_path": TEMP_DIR
-    }
+    """detailed health check (briefly cacheable to absorb probe bursts)"""
+    return ORJSONResponse(
+        {
+            "status": "healthy",
+            "temp_dir": TEMP_DIR.exists(),
+            "temp_dir_path": str(TEMP_DIR)
+        },
+        headers={"Cache-Control": "public, max-age=5"}
+    )
 
 
 class GenerateRequest(BaseModel):
@@ -151,28 +341,51 @@ class GenerateRequest(BaseModel):
         default=None,
         description="optional job id for progress tracking"
     )
+    file_format: ExportFormat = Field(
+        default=ExportFormat.OBJ,
+        description="output mesh format (obj is slower to export but universally supported)"
+    )
+
+
+# /quality-options is fully static, so build the payload and its etag once
+_QUALITY_OPTIONS_RESPONSE = {
+    "options": [
+        {
+            "value": quality.value,
+            "label": quality.value.title(),
+            "zoom": settings["zoom"],
+            "description": settings["description"]
+        }
+        for quality, settings in QUALITY_SETTINGS.items()
+    ],
+    "default": MeshQuality.MEDIUM.value
+}
+_QUALITY_OPTIONS_ETAG = '"{}"'.format(
+    hashlib.md5(repr(sorted(_QUALITY_OPTIONS_RESPONSE.items())).encode()).hexdigest()
+)
 
 
 @app.get("/quality-options")
-async def get_quality_options():
+async def get_quality_options(request: Request):
     """
     get available quality options with descriptions
-    
+
+    the payload is static, so browsers/cdns get an etag and a day of
+    cache; matching if-none-match short-circuits to a 304
+
     returns:
         dictionary of quality levels and their settings
     """
-    return {
-        "options": [
-            {
-                "value": quality.value,
-                "label": quality.value.title(),
-                "zoom": settings["zoom"],
-                "description": settings["description"]
-            }
-            for quality, settings in QUALITY_SETTINGS.items()
-        ],
-        "default": MeshQuality.MEDIUM.value
-    }
+    if request.headers.get("if-none-match") == _QUALITY_OPTIONS_ETAG:
+        return Response(status_code=304)
+
+    return ORJSONResponse(
+        _QUALITY_OPTIONS_RESPONSE,
+        headers={
+            "ETag": _QUALITY_OPTIONS_ETAG,
+            "Cache-Control": "public, max-age=86400"
+        }
+    )
 
 
 @app.get("/progress/{job_id}")
@@ -186,39 +399,50 @@ async def get_progress(job_id: str):
     returns:
         progress information (percent, message, status, download_url)
     """
-    if job_id not in progress_store:
-        raise HTTPException(status_code=404, detail="job not found")
-    
-    return progress_store[job_id]
+    # polled every 500ms by the ui: one store lookup, and a plain 404
+    # response instead of exception-based control flow on the miss path
+    job = progress_store.get(job_id)
+    if job is None:
+        return ORJSONResponse({"detail": "job not found"}, status_code=404)
+
+    return job
 
 
 @app.get("/download/{job_id}")
-async def download_mesh(job_id: str, background_tasks: BackgroundTasks):
+async def download_mesh(job_id: str):
     """
     download result for a completed job
-    
+
     args:
         job_id: job identifier
-        background_tasks: fastapi background task handler
-    
+
     returns:
         zip file if job is complete
     """
-    if job_id not in progress_store:
+    job = progress_store.get(job_id)
+    if job is None:
         raise HTTPException(status_code=404, detail="job not found")
-    
-    job = progress_store[job_id]
-    
+
     if job["status"] != "complete":
         raise HTTPException(status_code=400, detail="job not complete")
-    
+
+    # object-storage artifacts: redirect to a short-lived presigned url so
+    # the download bypasses the app server entirely
+    object_key = job.get("object_key")
+    if object_key and s3_client is not None:
+        url = s3_client.generate_presigned_url(
+            "get_object",
+            Params={"Bucket": ARTIFACT_BUCKET, "Key": object_key},
+            ExpiresIn=3600
+        )
+        return RedirectResponse(url, status_code=302)
+
     file_path = job.get("file_path")
-    if not file_path or not os.path.exists(file_path):
+    if not file_path or not Path(file_path).exists():
         raise HTTPException(status_code=500, detail="result file not found")
-    
-    # schedule file deletion after response is sent
-    background_tasks.add_task(os.remove, file_path)
-    
+
+    # the artifact stays on disk so identical requests can reuse it;
+    # it lives under the system temp dir and is reaped with it
     return FileResponse(
         path=file_path,
         media_type="application/zip",
@@ -226,22 +450,51 @@ async def download_mesh(job_id: str, background_tasks: BackgroundTasks):
     )
 
 
-def run_generation_task(job_id: str, bbox: BoundingBox, quality: MeshQuality, mapbox_token: str):
+def artifact_cache_key(bbox: BoundingBox, quality: MeshQuality, file_format: ExportFormat) -> str:
+    """
+    content key for a finished artifact: the pipeline is deterministic in
+    (bbox, quality, format), so equal inputs can share one zip
+    """
+    raw = (
+        f"{bbox.north:.5f},{bbox.south:.5f},{bbox.east:.5f},{bbox.west:.5f},"
+        f"{quality.value},{file_format.value}"
+    )
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+def run_generation_task(
+    job_id: str,
+    bbox: BoundingBox,
+    quality: MeshQuality,
+    mapbox_token: str,
+    file_format: ExportFormat = ExportFormat.OBJ
+):
     """
     background task for running mesh generation
     """
     import shutil
     
     # create job-specific temp dir to avoid collisions
-    job_dir = os.path.join(TEMP_DIR, job_id)
-    os.makedirs(job_dir, exist_ok=True)
+    job_dir = TEMP_DIR / job_id
+    job_dir.mkdir(exist_ok=True)
     
     try:
         # get quality settings
         quality_config = QUALITY_SETTINGS[quality]
         
-        # progress callback
+        # progress callback, coalesced: the pipeline can emit updates faster
+        # than they're worth persisting (each write is a network rtt on the
+        # redis store), so drop sub-1% updates arriving within 200ms
+        last_update = [0.0, -1]  # monotonic time, percent
+
         def update_progress(percent: int, message: str):
+            now = time.monotonic()
+            if (percent != 100
+                    and percent - last_update[1] < 1
+                    and now - last_update[0] < 0.2):
+                return
+            last_update[0] = now
+            last_update[1] = percent
             progress_store[job_id] = {
                 "percent": percent,
                 "message": message,
@@ -249,8 +502,9 @@ def run_generation_task(job_id: str, bbox: BoundingBox, quality: MeshQuality, ma
             }
         
         # generate mesh with quality settings
-        # pass job_dir instead of shared TEMP_DIR
-        generator = MeshGenerator(job_dir, mapbox_token)
+        # reuse the process-wide generator (persistent http sessions) and
+        # route this job's files into its own dir to avoid collisions
+        generator = get_generator(mapbox_token)
         obj_path, mtl_path, texture_files = generator.generate(
             north=bbox.north,
             south=bbox.south,
@@ -260,7 +514,9 @@ def run_generation_task(job_id: str, bbox: BoundingBox, quality: MeshQuality, ma
             include_textures=True,
             zoom_level=quality_config["zoom"],
             texture_max_dimension=quality_config["texture_max"],
-            progress_callback=update_progress
+            progress_callback=update_progress,
+            file_format=file_format.value,
+            output_dir=str(job_dir)
         )
         
         # verify obj file exists
@@ -280,52 +536,103 @@ def run_generation_task(job_id: str, bbox: BoundingBox, quality: MeshQuality, ma
         
         # CHECK FOR ALL MTL AND PNG FILES IN DIRECTORY
         # Trimesh auto-generates materials with various names
-        obj_dir = os.path.dirname(obj_path)
-        for f in os.listdir(obj_dir):
-            full_path = os.path.join(obj_dir, f)
+        obj_dir = Path(obj_path).parent
+        for entry in obj_dir.iterdir():
+            full_path = str(entry)
             if full_path in files_to_zip:
                 continue
-                
+
             # If it's an MTL file, or a Material PNG (usually material_0.png)
-            if f.endswith('.mtl') or (f.endswith('.png') and 'material' in f):
+            if entry.suffix == '.mtl' or (entry.suffix == '.png' and 'material' in entry.name):
                 files_to_zip.append(full_path)
         
-        # create zip file named with job_id in the main TEMP_DIR (not job_dir)
-        zip_filename = f"tark_{job_id}.zip"
-        zip_path = os.path.join(TEMP_DIR, zip_filename)
-        
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for file_path in files_to_zip:
+        # cap texture dimensions before zipping: the generator respects
+        # texture_max, but trimesh can emit material pngs (material_0.png)
+        # at arbitrary sizes, which bloat the artifact and downstream
+        # engine imports quadratically in pixel count
+        texture_cap = quality_config["texture_max"]
+        for p in files_to_zip:
+            if not p.endswith('.png'):
+                continue
+            try:
+                with Image.open(p) as img:
+                    if max(img.size) <= texture_cap:
+                        continue
+                    img.thumbnail((texture_cap, texture_cap), Image.LANCZOS)
+                    img.save(p, format="PNG", optimize=True)
+                logger.info("downscaled oversized texture %s", os.path.basename(p))
+            except OSError as e:
+                logger.warning("texture downscale skipped for %s: %s", p, e)
+
+        # zip is named by content key in the main TEMP_DIR (not job_dir), so
+        # later requests for the same (bbox, quality, format) can reuse it
+        zip_filename = f"tark_{artifact_cache_key(bbox, quality, file_format)}.zip"
+        zip_path = TEMP_DIR / zip_filename
+
+        # build under a per-job name, then rename into place: concurrent jobs
+        # for the same area would otherwise interleave writes into one file,
+        # and a reader can never see a half-written zip
+        tmp_zip_path = zip_path.with_name(f"{zip_path.name}.{job_id}.tmp")
+
+        # pre-read file contents in parallel (the reads release the GIL and
+        # overlap on disk latency); zipfile itself isn't thread-safe, so the
+        # writes stay on this thread
+        with ThreadPoolExecutor(max_workers=min(8, len(files_to_zip))) as pool:
+            payloads = list(pool.map(lambda p: (Path(p), Path(p).read_bytes()), files_to_zip))
+
+        with zipfile.ZipFile(tmp_zip_path, 'w') as zipf:
+            for file_path, data in payloads:
+                # pngs are already deflate-compressed, so store them verbatim;
+                # obj/mtl text gets a fast level-1 deflate pass
+                if file_path.suffix.lower() in ('.png', '.jpg', '.jpeg'):
+                    compress_args = {"compress_type": zipfile.ZIP_STORED}
+                else:
+                    compress_args = {"compress_type": zipfile.ZIP_DEFLATED, "compresslevel": 1}
+
                 # add file with just its basename (no directory structure)
-                zipf.write(file_path, arcname=os.path.basename(file_path))
-        
+                zipf.writestr(file_path.name, data, **compress_args)
+
+        # atomic publish
+        os.replace(tmp_zip_path, zip_path)
+
         # CLEANUP: remove the job directory containing raw obj/mtl/png files
         try:
             shutil.rmtree(job_dir)
-        except Exception as e:
-            print(f"Cleanup warning for job {job_id}: {e}")
+        except OSError as e:
+            logger.warning("cleanup warning for job %s: %s", job_id, e)
         
         # mark as complete
-        progress_store[job_id] = {
+        done = {
             "percent": 100,
             "message": "complete!",
             "status": "complete",
-            "file_path": zip_path
         }
+        if s3_client is not None:
+            # ship the artifact to the bucket (lifecycle rules handle
+            # expiry) and drop the local copy so app-server disk stays flat
+            object_key = artifact_object_key(zip_path.name)
+            s3_client.upload_file(str(zip_path), ARTIFACT_BUCKET, object_key)
+            zip_path.unlink()
+            done["object_key"] = object_key
+        else:
+            done["file_path"] = str(zip_path)
+        progress_store[job_id] = done
         
     except Exception as e:
-        print(f"Job {job_id} failed: {str(e)}")
-        traceback.print_exc()
+        # this runs on a background thread, so the error must land in the
+        # progress store for the poller; logger.exception records the
+        # traceback once instead of print + print_exc re-formatting it
+        logger.exception("job %s failed", job_id)
         progress_store[job_id] = {
             "percent": 0,
-            "message": f"error: {str(e)}",
+            "message": f"error: {e}",
             "status": "error"
         }
         # attempt cleanup on failure too
-        if os.path.exists(job_dir):
+        if job_dir.exists():
             try:
                 shutil.rmtree(job_dir)
-            except:
+            except OSError:
                 pass
 
 
@@ -348,9 +655,8 @@ async def generate_mesh(
         # validate bounding box immediately
         request.bbox.validate_bbox()
         
-        # get mapbox token
-        mapbox_token = os.getenv("MAPBOX_ACCESS_TOKEN")
-        if not mapbox_token:
+        # token is cached at module import
+        if not MAPBOX_TOKEN:
             raise HTTPException(
                 status_code=500,
                 detail="MAPBOX_ACCESS_TOKEN not configured"
@@ -358,7 +664,37 @@ async def generate_mesh(
         
         # create or use provided job id
         job_id = request.job_id or str(uuid.uuid4())
-        
+
+        # reuse a cached artifact when the same (bbox, quality, format) was
+        # already generated - skips the whole pipeline
+        zip_filename = (
+            f"tark_{artifact_cache_key(request.bbox, request.quality, request.file_format)}.zip"
+        )
+        cached = None
+        if s3_client is not None:
+            # artifact lives in the bucket (until its lifecycle expiry)
+            object_key = artifact_object_key(zip_filename)
+            try:
+                s3_client.head_object(Bucket=ARTIFACT_BUCKET, Key=object_key)
+                cached = {"object_key": object_key}
+            except s3_client.exceptions.ClientError:
+                pass
+        elif (TEMP_DIR / zip_filename).exists():
+            cached = {"file_path": str(TEMP_DIR / zip_filename)}
+
+        if cached is not None:
+            progress_store[job_id] = {
+                "percent": 100,
+                "message": "complete!",
+                "status": "complete",
+                **cached
+            }
+            return {
+                "job_id": job_id,
+                "message": "cached result",
+                "status": "complete"
+            }
+
         # initialize progress
         progress_store[job_id] = {
             "percent": 0,
@@ -366,14 +702,29 @@ async def generate_mesh(
             "status": "queued"
         }
         
-        # schedule background task
-        background_tasks.add_task(
-            run_generation_task,
-            job_id,
-            request.bbox,
-            request.quality,
-            mapbox_token
-        )
+        # dispatch to the celery worker pool when a broker is configured
+        # (keeps the heavy pipeline out of the api process); otherwise run
+        # it as an in-process background task
+        if celery_app is not None:
+            celery_app.send_task(
+                "tark.generate_mesh",
+                args=[
+                    job_id,
+                    request.bbox.model_dump(),
+                    request.quality.value,
+                    MAPBOX_TOKEN,
+                    request.file_format.value
+                ]
+            )
+        else:
+            background_tasks.add_task(
+                run_generation_task,
+                job_id,
+                request.bbox,
+                request.quality,
+                MAPBOX_TOKEN,
+                request.file_format
+            )
         
         return {
             "job_id": job_id,
@@ -382,12 +733,16 @@ async def generate_mesh(
         }
         
     except ValueError as e:
+        # bad bbox -> 400; anything unexpected propagates to fastapi's
+        # default 500 handler, which already logs the traceback once
         raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"internal error: {str(e)}")
 
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop + httptools replace the stdlib event loop and pure-python h11
+    # parser (both ship with uvicorn[standard]). single worker for now:
+    # progress_store lives in process memory, so multiple workers would
+    # each see a different job table.
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="uvloop", http="httptools")
 
@@ -4,10 +4,36 @@ converts elevation raster to 3d mesh
 """
 import numpy as np
 import trimesh
+from functools import lru_cache
 from typing import List, Tuple
 from app.utils.coords import CoordinateTransformer
 
 
+@lru_cache(maxsize=16)
+def _grid_uvs(rows: int, cols: int) -> np.ndarray:
+    """
+    build (and cache) the 0-1 uv grid for a rows x cols terrain
+
+    the uv layout depends only on the grid shape, and repeated requests
+    at the same quality level produce the same shapes, so the buffer is
+    memoized; it is marked read-only because cache hits share one array
+    (trimesh copies it on visual assignment anyway)
+    """
+    # broadcast the per-axis ramps straight into one preallocated
+    # buffer (u repeats along each row, v is constant within a row);
+    # float32 is plenty of precision for 0-1 texture coordinates
+    u = np.linspace(0, 1, cols, dtype=np.float32)  # u (x)
+    v = np.linspace(0, 1, rows, dtype=np.float32)  # v (y)
+
+    uvs = np.empty((rows * cols, 2), dtype=np.float32)
+    uv_grid = uvs.reshape(rows, cols, 2)
+    uv_grid[..., 0] = u
+    uv_grid[..., 1] = v[:, None]
+
+    uvs.setflags(write=False)
+    return uvs
+
+
 class TerrainGenerator:
     """
     generates terrain mesh from elevation data
@@ -22,22 +48,34 @@ class TerrainGenerator:
         elevation_data: np.ndarray,
         bounds: tuple,
         resolution: float = 30.0,
-        generate_uvs: bool = True
+        generate_uvs: bool = True,
+        max_resolution: int = None
     ) -> trimesh.Trimesh:
         """
         generate terrain mesh from elevation data
-        
+
         args:
             elevation_data: 2d numpy array of elevation values (meters)
             bounds: (west, south, east, north) in degrees
             resolution: resolution in meters (default: 30m for mapbox)
             generate_uvs: whether to generate uv texture coordinates
-        
+            max_resolution: optional cap on grid points per axis; larger
+                grids are stride-decimated (quadratic face/vertex savings)
+
         returns:
             trimesh.trimesh object representing the terrain
         """
         west, south, east, north = bounds
         rows, cols = elevation_data.shape
+
+        # optional lod: stride-decimate dense grids before meshing. the
+        # fetcher's gaussian smoothing has already low-passed the data,
+        # so plain striding (a view, no copy) doesn't alias
+        if max_resolution and max(rows, cols) > max_resolution:
+            stride = -(-max(rows, cols) // max_resolution)  # ceil div
+            elevation_data = elevation_data[::stride, ::stride]
+            rows, cols = elevation_data.shape
+            resolution = resolution * stride
         
         # flip elevation data to match coordinate system
         # mapbox returns: row 0 = north, row -1 = south
@@ -55,18 +93,25 @@ class TerrainGenerator:
         # and west to east (cols)
         lats = np.linspace(south, north, rows)
         lons = np.linspace(west, east, cols)
-        lon_grid, lat_grid = np.meshgrid(lons, lats)
-        
+        # copy=False: broadcast views instead of materializing two full grids
+        lon_grid, lat_grid = np.meshgrid(lons, lats, copy=False)
+
         # 3. transform to local coordinates (meters)
         # x = easting (positive), z = northing (positive)
         x_grid, z_grid = transformer.latlon_array_to_local(lat_grid, lon_grid)
-        
+
         # 4. create vertices (x, y, z)
         # y = elevation (up)
-        vertices = np.zeros((rows * cols, 3))
-        vertices[:, 0] = x_grid.flatten()
-        vertices[:, 1] = elevation_data.flatten()
-        vertices[:, 2] = z_grid.flatten()
+        # float32 halves the bandwidth through assembly and merge; trimesh
+        # upcasts to float64 on construction but the merge buffers stay compact
+        # fill as (rows, cols, 3) so the 2d grids (including the flipud
+        # view of the elevation) write straight in without ravel copies,
+        # then collapse to the flat vertex list as a free reshape
+        vertices = np.empty((rows, cols, 3), dtype=np.float32)
+        vertices[..., 0] = x_grid
+        vertices[..., 1] = elevation_data
+        vertices[..., 2] = z_grid
+        vertices = vertices.reshape(-1, 3)
         
         # 5. generate triangle faces
         faces = self._generate_faces(rows, cols)
@@ -77,12 +122,17 @@ class TerrainGenerator:
             uvs = self._generate_uvs(rows, cols)
         
         # 7. create mesh
-        mesh = trimesh.Trimesh(vertices=vertices, faces=faces)
+        # process=False: the grid has no duplicate/degenerate geometry, and the
+        # default processing pass hashes every vertex just to find out
+        mesh = trimesh.Trimesh(vertices=vertices, faces=faces, process=False)
         
         # Store grid metadata for building placement logic
         mesh.metadata['grid_dims'] = (rows, cols)
         mesh.metadata['bounds'] = bounds
         mesh.metadata['elevation'] = elevation_data
+        # the regular grid has no duplicate or degenerate geometry by
+        # construction, so downstream optimize_mesh can skip its passes
+        mesh.metadata['is_deduped'] = True
         
         # 8. attach uv coordinates to mesh
         if uvs is not None:
@@ -109,43 +159,60 @@ class TerrainGenerator:
         returns:
             modified terrain mesh with smoothly flattened areas under buildings
         """
-        from shapely.geometry import Polygon, Point
-        
+        import shapely
+        from shapely.geometry import Polygon
+
         vertices = terrain_mesh.vertices.copy()
         original_elevations = vertices[:, 1].copy()
-        
+        xs = vertices[:, 0]
+        zs = vertices[:, 2]
+
         for footprint_xz, base_elevation in building_footprints:
             # create polygon from footprint
             poly = Polygon(footprint_xz)
-            
-            # find vertices to modify
-            for i in range(len(vertices)):
-                point = Point(vertices[i, 0], vertices[i, 2])  # x, z
-                
-                if poly.contains(point):
-                    # inside footprint: flatten completely
-                    vertices[i, 1] = base_elevation
-                else:
-                    # outside: check distance for blending
-                    distance = poly.exterior.distance(point)
-                    
-                    if distance < blend_distance:
-                        # blend zone: interpolate between flat and original
-                        # weight: 1.0 at edge, 0.0 at blend_distance
-                        weight = 1.0 - (distance / blend_distance)
-                        weight = weight ** 2  # smooth falloff (quadratic)
-                        
-                        blended_elevation = (
-                            base_elevation * weight +
-                            original_elevations[i] * (1 - weight)
-                        )
-                        vertices[i, 1] = blended_elevation
+
+            # cheap aabb prefilter: only vertices near this footprint can
+            # be flattened or blended, so skip the rest before any
+            # geometry predicate runs
+            min_x, min_z, max_x, max_z = poly.bounds
+            candidates = np.flatnonzero(
+                (xs >= min_x - blend_distance) & (xs <= max_x + blend_distance) &
+                (zs >= min_z - blend_distance) & (zs <= max_z + blend_distance)
+            )
+            if candidates.size == 0:
+                continue
+
+            # inside footprint: flatten completely (bulk predicate runs
+            # in C instead of one shapely call per vertex)
+            inside = shapely.contains_xy(poly, xs[candidates], zs[candidates])
+            vertices[candidates[inside], 1] = base_elevation
+
+            # outside: blend zone within blend_distance of the edge
+            outside = candidates[~inside]
+            if outside.size == 0:
+                continue
+            points = shapely.points(xs[outside], zs[outside])
+            distances = shapely.distance(poly.exterior, points)
+
+            near = distances < blend_distance
+            blend_idx = outside[near]
+            if blend_idx.size == 0:
+                continue
+            # weight: 1.0 at edge, 0.0 at blend_distance; quadratic falloff
+            weights = (1.0 - distances[near] / blend_distance) ** 2
+            vertices[blend_idx, 1] = (
+                base_elevation * weights +
+                original_elevations[blend_idx] * (1.0 - weights)
+            )
         
         # create new mesh with modified vertices
+        # process=False keeps the grid vertex order intact (building placement
+        # relies on it via grid_dims metadata)
         flattened_mesh = trimesh.Trimesh(
             vertices=vertices,
             faces=terrain_mesh.faces,
-            visual=terrain_mesh.visual
+            visual=terrain_mesh.visual,
+            process=False
         )
         
         # preserve metadata
@@ -158,41 +225,26 @@ class TerrainGenerator:
         generate triangle faces for a regular grid
         standard counter-clockwise winding order
         """
-        faces = []
-        
-        for r in range(rows - 1):
-            for c in range(cols - 1):
-                # vertex indices for current cell
-                # grid is flattened row by row
-                v0 = r * cols + c           # top-left
-                v1 = r * cols + (c + 1)     # top-right
-                v2 = (r + 1) * cols + c     # bottom-left
-                v3 = (r + 1) * cols + (c + 1) # bottom-right
-                
-                # two triangles per cell
-                # Reversed winding to fix "facing core" issue
-                # 1. top-left -> top-right -> bottom-left
-                faces.append([v0, v1, v2])
-                
-                # 2. top-right -> bottom-right -> bottom-left
-                faces.append([v1, v3, v2])
-        
-        return np.array(faces)
+        # vectorized cell-corner indices; grid is flattened row by row
+        r, c = np.indices((rows - 1, cols - 1))
+        v0 = (r * cols + c).ravel()  # top-left
+        v1 = v0 + 1                  # top-right
+        v2 = v0 + cols               # bottom-left
+        v3 = v2 + 1                  # bottom-right
+
+        # two triangles per cell, interleaved to keep the original face order
+        # Reversed winding to fix "facing core" issue
+        faces = np.empty((v0.size * 2, 3), dtype=np.int32)
+        # 1. top-left -> top-right -> bottom-left
+        faces[0::2] = np.stack([v0, v1, v2], axis=1)
+        # 2. top-right -> bottom-right -> bottom-left
+        faces[1::2] = np.stack([v1, v3, v2], axis=1)
+
+        return faces
     
     def _generate_uvs(self, rows: int, cols: int) -> np.ndarray:
         """
         generate standard 0-1 uv coordinates based on grid index
         (0,0) = bottom-left, (1,1) = top-right
         """
-        uvs = np.zeros((rows * cols, 2))
-        
-        # generate grid of indices
-        c_indices = np.linspace(0, 1, cols)
-        r_indices = np.linspace(0, 1, rows)
-        
-        u_grid, v_grid = np.meshgrid(c_indices, r_indices)
-        
-        uvs[:, 0] = u_grid.flatten() # u (x)
-        uvs[:, 1] = v_grid.flatten() # v (y)
-        
-        return uvs
+        return _grid_uvs(rows, cols)
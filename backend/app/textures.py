@@ -3,10 +3,10 @@ texture generation and fetching for meshes
 handles satellite imagery and procedural textures
 """
 import requests
-import numpy as np
 from PIL import Image
 from io import BytesIO
 from typing import Tuple, Optional
+import math
 import os
 
 
@@ -25,6 +25,12 @@ class MapboxSatelliteFetcher:
         self.access_token = access_token
         self.base_url = "https://api.mapbox.com/styles/v1"
         self.style = "mapbox/satellite-v9"
+        # persistent session: reuse the connection across fetches
+        self.session = requests.Session()
+        self.session.mount(
+            "https://",
+            requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        )
     
     def fetch_satellite_image(
         self,
@@ -65,17 +71,20 @@ class MapboxSatelliteFetcher:
         }
         
         try:
-            response = requests.get(url, params=params, timeout=30)
+            response = self.session.get(url, params=params, timeout=30)
             response.raise_for_status()
             
             # load image from response
             image = Image.open(BytesIO(response.content))
-            
-            # save if output path provided
+
+            # save if output path provided: write the bytes mapbox sent
+            # instead of re-encoding the decoded image (a full zlib pass
+            # for a byte-identical png)
             if output_path:
                 os.makedirs(os.path.dirname(output_path), exist_ok=True)
-                image.save(output_path, format='PNG')
-            
+                with open(output_path, 'wb') as f:
+                    f.write(response.content)
+
             return image, output_path if output_path else None
             
         except requests.exceptions.RequestException as e:
@@ -98,9 +107,10 @@ class MapboxSatelliteFetcher:
             tuple of (width, height) in pixels
         """
         # calculate approximate bbox dimensions in meters
+        # (math.cos over np.cos: scalar trig without ufunc dispatch)
         center_lat = (north + south) / 2
         lat_meters = abs(north - south) * 111000
-        lng_meters = abs(east - west) * 111000 * abs(np.cos(np.radians(center_lat)))
+        lng_meters = abs(east - west) * 111000 * abs(math.cos(math.radians(center_lat)))
         
         # target: ~1 meter per pixel for good detail
         # but clamp to mapbox free tier limit (1280x1280)
@@ -120,8 +130,11 @@ class TextureGenerator:
     """
     
     def __init__(self):
-        pass
-    
+        # solid-color tiles carry no per-pixel information, so repeated
+        # requests for the same type/size share one cached image instead
+        # of re-allocating (and memsetting) a fresh buffer each call
+        self._tile_cache = {}
+
     def generate_building_texture(
         self,
         building_type: str,
@@ -141,7 +154,12 @@ class TextureGenerator:
         """
         # todo: implement procedural texture generation
         # for now, return solid colors based on type
-        
+
+        key = (building_type, width, height)
+        cached = self._tile_cache.get(key)
+        if cached is not None:
+            return cached
+
         color_map = {
             "residential": (200, 180, 160),  # beige/tan
             "commercial": (180, 180, 180),   # light grey
@@ -154,6 +172,7 @@ class TextureGenerator:
         
         color = color_map.get(building_type, (180, 180, 180))
         image = Image.new('RGB', (width, height), color)
-        
+        self._tile_cache[key] = image
+
         return image
 
@@ -3,27 +3,127 @@ mesh utility functions
 helper functions for mesh operations and export
 """
 import trimesh
+import numpy as np
 from typing import List
 import os
 
 
-def merge_meshes(meshes: List[trimesh.Trimesh]) -> trimesh.Trimesh:
+def merge_meshes(
+    meshes: List[trimesh.Trimesh],
+    dedupe: bool = False
+) -> trimesh.Trimesh:
     """
     merge multiple meshes into a single mesh
-    
+
+    single-pass merge into preallocated arrays. trimesh.util.concatenate
+    repeatedly concatenates python lists of arrays and re-processes the
+    result, which gets expensive for hundreds of building meshes.
+
     args:
         meshes: list of trimesh.trimesh objects
-    
+        dedupe: weld duplicate vertices in the merged result (runs the
+            optimize_mesh pass on the freshly filled buffers, before
+            any caller holds a reference to them). don't use on meshes
+            exploded to flat faces for hard edges: welding re-fuses the
+            corners and the averaged vertex normals smooth-shade them
+
     returns:
         single merged trimesh.trimesh
     """
     if not meshes:
         raise ValueError("No meshes to merge")
-    
+
     if len(meshes) == 1:
-        return meshes[0]
-    
-    return trimesh.util.concatenate(meshes)
+        return optimize_mesh(meshes[0]) if dedupe else meshes[0]
+
+    # first pass: total sizes
+    total_v = sum(len(m.vertices) for m in meshes)
+    total_f = sum(len(m.faces) for m in meshes)
+
+    vertices = np.empty((total_v, 3), dtype=np.float32)
+    faces = np.empty((total_f, 3), dtype=np.int32)
+
+    # only carry uvs through if every input mesh has them
+    has_uvs = all(
+        isinstance(m.visual, trimesh.visual.TextureVisuals) and m.visual.uv is not None
+        for m in meshes
+    )
+    uvs = np.empty((total_v, 2), dtype=np.float32) if has_uvs else None
+
+    # second pass: copy with index offsets
+    v_offset = 0
+    f_offset = 0
+    for m in meshes:
+        n_v = len(m.vertices)
+        n_f = len(m.faces)
+        vertices[v_offset:v_offset + n_v] = m.vertices
+        faces[f_offset:f_offset + n_f] = m.faces + v_offset
+        if uvs is not None:
+            uvs[v_offset:v_offset + n_v] = m.visual.uv
+        v_offset += n_v
+        f_offset += n_f
+
+    merged = trimesh.Trimesh(vertices=vertices, faces=faces, process=False)
+    if uvs is not None:
+        merged.visual = trimesh.visual.TextureVisuals(uv=uvs)
+
+    if dedupe:
+        # weld shared vertices along submesh boundaries while the merge
+        # buffers are still the only copy in flight (textured meshes
+        # keep their seams; see optimize_mesh)
+        return optimize_mesh(merged)
+
+    return merged
+
+
+def write_obj_fast(
+    mesh: trimesh.Trimesh,
+    obj_path: str,
+    include_normals: bool = True
+) -> str:
+    """
+    vectorized single-mesh obj writer
+
+    trimesh's obj exporter assembles every line through generic python
+    string handling; np.savetxt keeps the formatting in C. fixed decimal
+    precision is plenty at meter scale and deflates better than %g.
+
+    args:
+        mesh: trimesh.trimesh object
+        obj_path: full path of the .obj file to write
+        include_normals: whether to include vertex normals
+
+    returns:
+        path to the exported .obj file
+    """
+    vertices = np.asarray(mesh.vertices)
+    faces = np.asarray(mesh.faces) + 1  # obj indices are 1-based
+
+    uv = None
+    if isinstance(mesh.visual, trimesh.visual.TextureVisuals) and mesh.visual.uv is not None:
+        uv = np.asarray(mesh.visual.uv)
+
+    normals = mesh.vertex_normals if include_normals else None
+
+    with open(obj_path, 'wb') as f:
+        np.savetxt(f, vertices, fmt='v %.4f %.4f %.4f')
+        if uv is not None:
+            np.savetxt(f, uv, fmt='vt %.6f %.6f')
+        if normals is not None:
+            np.savetxt(f, normals, fmt='vn %.4f %.4f %.4f')
+
+        # v/vt/vn share the same index layout, so faces just repeat columns
+        if uv is not None and normals is not None:
+            np.savetxt(f, faces[:, [0, 0, 0, 1, 1, 1, 2, 2, 2]],
+                       fmt='f %d/%d/%d %d/%d/%d %d/%d/%d')
+        elif uv is not None:
+            np.savetxt(f, faces[:, [0, 0, 1, 1, 2, 2]], fmt='f %d/%d %d/%d %d/%d')
+        elif normals is not None:
+            np.savetxt(f, faces[:, [0, 0, 1, 1, 2, 2]], fmt='f %d//%d %d//%d %d//%d')
+        else:
+            np.savetxt(f, faces, fmt='f %d %d %d')
+
+    return obj_path
 
 
 def export_obj(
@@ -32,53 +132,110 @@ def export_obj(
     include_normals: bool = True
 ) -> str:
     """
-    export mesh to obj format with mtl
-    
+    export mesh to obj format
+
     args:
         mesh: trimesh.trimesh object
         output_path: path for output .obj file (without extension)
         include_normals: whether to include vertex normals
-    
+
     returns:
         path to the exported .obj file
     """
     obj_path = f"{output_path}.obj"
-    
-    # export with trimesh
-    # if a filename is provided, trimesh writes to disk and returns the exported bytes or None
-    result = mesh.export(obj_path, file_type='obj', include_normals=include_normals)
-    
-    return obj_path
+
+    # geometry-only vectorized writer (no mtl): this path serves the
+    # debug exports, where materials don't matter but wall time does
+    return write_obj_fast(mesh, obj_path, include_normals=include_normals)
 
 
 def optimize_mesh(
     mesh: trimesh.Trimesh,
     target_faces: int = None,
-    merge_vertices: bool = True
+    merge_vertices: bool = True,
+    precision: float = 0.001,
+    already_clean: bool = False
 ) -> trimesh.Trimesh:
     """
     optimize mesh for game engine use
-    
+
     args:
         mesh: input mesh
         target_faces: target face count (none = no decimation)
         merge_vertices: whether to merge duplicate vertices
-    
+        precision: weld tolerance in mesh units; vertices whose
+            coordinates round to the same multiple of this collapse
+            together (1mm default is invisible at meter scale and makes
+            the weld robust to float32 round-trips). none or 0 welds on
+            exact bit patterns only
+        already_clean: caller guarantees no duplicate/degenerate
+            geometry; the mesh is returned untouched. generators that
+            build duplicate-free meshes by construction (the terrain
+            grid) advertise the same thing via the is_deduped metadata
+            flag
+
     returns:
         optimized mesh
     """
-    # merge duplicate vertices
+    if already_clean or mesh.metadata.get("is_deduped"):
+        return mesh
+
+    vertices = np.asarray(mesh.vertices)
+    faces = np.asarray(mesh.faces)
+
+    uv = None
+    if isinstance(mesh.visual, trimesh.visual.TextureVisuals) and mesh.visual.uv is not None:
+        uv = np.asarray(mesh.visual.uv)
+
+    # weld duplicate vertices with one sort-based np.unique pass instead
+    # of trimesh's per-vertex hashing. textured meshes weld on
+    # position+uv so texture seams stay intact (the same rule as
+    # trimesh.merge_vertices with its default merge_tex=False)
     if merge_vertices:
-        mesh.merge_vertices()
-    
-    # remove degenerate faces
-    mesh.remove_degenerate_faces()
-    
-    # remove duplicate faces
-    mesh.remove_duplicate_faces()
-    
+        key = vertices if uv is None else np.column_stack([vertices, uv])
+        if precision:
+            # integer quantization: welds near-coincident vertices (the
+            # standard epsilon-welding trick) and halves the key width
+            # np.unique has to sort compared to float64 rows
+            key = np.round(key / precision).astype(np.int64)
+        key = np.ascontiguousarray(key)
+        packed = key.view([('', key.dtype)] * key.shape[1]).ravel()
+        _, first_idx, inverse = np.unique(packed, return_index=True, return_inverse=True)
+
+        # np.unique sorts by value; remap to first-occurrence order so
+        # the weld is stable with respect to the input vertex order
+        order = np.argsort(first_idx)
+        rank = np.empty_like(order)
+        rank[order] = np.arange(order.size)
+
+        vertices = vertices[first_idx[order]]
+        if uv is not None:
+            uv = uv[first_idx[order]]
+        faces = rank[inverse][faces]
+
+    # drop degenerate faces (any repeated corner index after welding);
+    # skip the boolean-index copy on the common all-clean case
+    valid = (
+        (faces[:, 0] != faces[:, 1]) &
+        (faces[:, 1] != faces[:, 2]) &
+        (faces[:, 2] != faces[:, 0])
+    )
+    if not valid.all():
+        faces = faces[valid]
+
+    # drop duplicate faces regardless of winding; keep first occurrences
+    # in their original order
+    _, keep = np.unique(np.sort(faces, axis=1), axis=0, return_index=True)
+    if keep.size != len(faces):
+        faces = faces[np.sort(keep)]
+
     # todo: add mesh decimation if target_faces is specified
     # this requires additional libraries like pymeshlab
-    
-    return mesh
+
+    optimized = trimesh.Trimesh(vertices=vertices, faces=faces, process=False)
+    if uv is not None:
+        optimized.visual = trimesh.visual.TextureVisuals(uv=uv)
+    optimized.metadata = mesh.metadata.copy()
+
+    return optimized
 
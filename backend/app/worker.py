@@ -0,0 +1,52 @@
+"""
+optional celery worker for mesh generation
+
+running the pipeline inside the api process (BackgroundTasks) caps
+throughput at one server and lets numpy/trimesh starve the event loop of
+gil time. when a broker is configured, jobs are dispatched here instead
+and picked up by dedicated workers:
+
+    celery -A app.worker worker --concurrency=2
+
+requires CELERY_BROKER_URL (typically the same redis instance used for
+the progress store); without it the api falls back to BackgroundTasks.
+"""
+import os
+
+try:
+    from celery import Celery
+    HAS_CELERY = True
+except ImportError:
+    HAS_CELERY = False
+
+# explicit opt-in only: REDIS_URL alone configures the shared progress
+# store (main.py) and must not start routing jobs into a celery queue
+# that no worker consumes
+CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL")
+
+celery_app = None
+if HAS_CELERY and CELERY_BROKER_URL:
+    celery_app = Celery("tark", broker=CELERY_BROKER_URL)
+    celery_app.conf.update(
+        task_serializer="json",
+        accept_content=["json"],
+        # generation is cpu/io heavy and long; don't prefetch a queue of
+        # jobs onto one worker while others sit idle
+        worker_prefetch_multiplier=1,
+        task_acks_late=True,
+    )
+
+    @celery_app.task(name="tark.generate_mesh")
+    def generate_mesh_task(job_id: str, bbox: dict, quality: str, mapbox_token: str, file_format: str):
+        # imported lazily: app.main imports this module to dispatch, so a
+        # top-level import here would be circular
+        from app.main import (
+            run_generation_task, BoundingBox, MeshQuality, ExportFormat
+        )
+        run_generation_task(
+            job_id,
+            BoundingBox(**bbox),
+            MeshQuality(quality),
+            mapbox_token,
+            ExportFormat(file_format),
+        )
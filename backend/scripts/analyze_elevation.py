@@ -13,30 +13,51 @@ def analyze_elevation():
     
     # load test elevation data
     fixtures_dir = Path(__file__).parent.parent / "tests" / "fixtures"
-    elevation_data = np.load(fixtures_dir / "test_elevation_data.npy")
+    # memory-map the fixture: the analysis only streams over it once,
+    # so pages come in on demand instead of reading the file up front
+    elevation_data = np.load(fixtures_dir / "test_elevation_data.npy", mmap_mode='r')
     
     print("elevation data analysis")
     print("=" * 60)
     
     rows, cols = elevation_data.shape
+
+    # stats in three streaming reductions instead of np.std's extra
+    # two-pass scan: std comes from the second moment (float64
+    # accumulation keeps the subtraction well conditioned), and the
+    # result is reused for the recommendation below
+    emin, emax = np.min(elevation_data), np.max(elevation_data)
+    emean = np.mean(elevation_data, dtype=np.float64)
+    sum_sq = np.einsum('ij,ij->', elevation_data, elevation_data, dtype=np.float64)
+    estd = np.sqrt(max(sum_sq / elevation_data.size - emean * emean, 0.0))
+
     print(f"\nshape: {rows} x {cols}")
-    print(f"min: {np.min(elevation_data):.2f}m")
-    print(f"max: {np.max(elevation_data):.2f}m")
-    print(f"mean: {np.mean(elevation_data):.2f}m")
-    print(f"std: {np.std(elevation_data):.2f}m")
-    
-    # calculate gradients (elevation changes between adjacent pixels)
-    grad_y = np.abs(np.diff(elevation_data, axis=0))
-    grad_x = np.abs(np.diff(elevation_data, axis=1))
-    
-    print(f"\ngradients (pixel-to-pixel):")
-    print(f"  vertical mean: {np.mean(grad_y):.2f}m, max: {np.max(grad_y):.2f}m")
-    print(f"  horizontal mean: {np.mean(grad_x):.2f}m, max: {np.max(grad_x):.2f}m")
+    print(f"min: {emin:.2f}m")
+    print(f"max: {emax:.2f}m")
+    print(f"mean: {emean:.2f}m")
+    print(f"std: {estd:.2f}m")
     
-    # find areas with large gradients (noise/artifacts)
+    # calculate gradients (elevation changes between adjacent pixels);
+    # both axes share one scratch buffer, so the scan touches one
+    # array-sized temporary instead of four
     threshold = 5.0
-    large_grad_y = np.sum(grad_y > threshold)
-    large_grad_x = np.sum(grad_x > threshold)
+    scratch = np.empty(elevation_data.shape, dtype=elevation_data.dtype)
+
+    grad_y = np.subtract(elevation_data[1:], elevation_data[:-1], out=scratch[:-1])
+    np.abs(grad_y, out=grad_y)
+    grad_y_mean, grad_y_max = np.mean(grad_y), np.max(grad_y)
+    # count_nonzero over sum: counts the boolean mask directly without
+    # an intermediate integer accumulation pass
+    large_grad_y = np.count_nonzero(grad_y > threshold)
+
+    grad_x = np.subtract(elevation_data[:, 1:], elevation_data[:, :-1], out=scratch[:, :-1])
+    np.abs(grad_x, out=grad_x)
+    grad_x_mean, grad_x_max = np.mean(grad_x), np.max(grad_x)
+    large_grad_x = np.count_nonzero(grad_x > threshold)
+
+    print(f"\ngradients (pixel-to-pixel):")
+    print(f"  vertical mean: {grad_y_mean:.2f}m, max: {grad_y_max:.2f}m")
+    print(f"  horizontal mean: {grad_x_mean:.2f}m, max: {grad_x_max:.2f}m")
     
     print(f"\nsuspicious gradients (>{threshold}m):")
     print(f"  vertical: {large_grad_y} locations")
@@ -51,10 +72,9 @@ def analyze_elevation():
     
     # recommendation
     print(f"\nrecommendation:")
-    std = np.std(elevation_data)
-    if std < 5:
+    if estd < 5:
         print("  very flat terrain - use sigma=2-3")
-    elif std < 20:
+    elif estd < 20:
         print("  relatively flat - use sigma=2-3 for cleaner terrain")
     else:
         print("  significant elevation changes - current smoothing ok")
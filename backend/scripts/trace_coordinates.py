@@ -143,11 +143,9 @@ def trace_pipeline():
         building = building_data[0]
         coords = building["coordinates"]
         
-        # calculate centroid
-        lons = [c[0] for c in coords]
-        lats = [c[1] for c in coords]
-        centroid_lat = np.mean(lats)
-        centroid_lon = np.mean(lons)
+        # calculate centroid (one array pass, no intermediate lists)
+        coords_arr = np.asarray(coords, dtype=np.float64)
+        centroid_lon, centroid_lat = coords_arr.mean(axis=0)
         
         print(f"\nbuilding 0 (id={building['id']}):")
         print(f"  centroid: lat={centroid_lat:.6f}, lon={centroid_lon:.6f}")
@@ -0,0 +1,112 @@
+import numpy as np
+import trimesh
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.utils.mesh import merge_meshes, optimize_mesh
+
+
+def _textured_box(offset):
+    """unit box with a dummy uv channel, translated by offset"""
+    mesh = trimesh.creation.box()
+    mesh.apply_translation(offset)
+    mesh.visual = trimesh.visual.TextureVisuals(
+        uv=np.zeros((len(mesh.vertices), 2), dtype=np.float32)
+    )
+    return mesh
+
+
+def test_optimize_mesh_welds_within_precision():
+    """vertices closer than the weld precision collapse together"""
+    vertices = np.array([
+        [0.0, 0.0, 0.0],
+        [1.0, 0.0, 0.0],
+        [0.0, 1.0, 0.0],
+        [1e-5, 0.0, -1e-5],  # float32-noise twin of vertex 0
+        [2.0, 0.0, 0.0],
+    ])
+    mesh = trimesh.Trimesh(
+        vertices=vertices, faces=[[0, 1, 2], [3, 1, 4]], process=False
+    )
+
+    welded = optimize_mesh(mesh)
+    assert len(welded.vertices) == 4
+    assert len(welded.faces) == 2
+
+    # exact mode keeps the near-duplicates distinct
+    exact = optimize_mesh(mesh, precision=None)
+    assert len(exact.vertices) == 5
+
+
+def test_optimize_mesh_drops_degenerate_and_duplicate_faces():
+    vertices = np.array([
+        [0.0, 0.0, 0.0],
+        [1.0, 0.0, 0.0],
+        [0.0, 1.0, 0.0],
+        [2.0, 0.0, 0.0],
+    ])
+    faces = [
+        [0, 1, 2],
+        [1, 1, 3],  # degenerate (repeated corner)
+        [0, 1, 2],  # exact duplicate
+        [2, 1, 0],  # duplicate with different winding
+        [1, 3, 2],
+    ]
+    mesh = trimesh.Trimesh(vertices=vertices, faces=faces, process=False)
+
+    cleaned = optimize_mesh(mesh)
+    assert len(cleaned.faces) == 2
+
+
+def test_optimize_mesh_keeps_uv_seams():
+    """same position with different uv must not weld (texture seam)"""
+    vertices = np.array([
+        [0.0, 0.0, 0.0],
+        [1.0, 0.0, 0.0],
+        [0.0, 1.0, 0.0],
+        [0.0, 0.0, 0.0],  # coincident with vertex 0, different uv
+    ])
+    uv = np.array([[0, 0], [1, 0], [0, 1], [0.5, 0.5]], dtype=np.float64)
+    mesh = trimesh.Trimesh(
+        vertices=vertices, faces=[[0, 1, 2], [3, 1, 2]], process=False
+    )
+    mesh.visual = trimesh.visual.TextureVisuals(uv=uv)
+
+    optimized = optimize_mesh(mesh)
+    assert len(optimized.vertices) == 4
+    assert len(optimized.faces) == 2
+    assert len(optimized.visual.uv) == len(optimized.vertices)
+
+
+def test_merge_meshes_preserves_uv_length():
+    merged = merge_meshes([_textured_box([0, 0, 0]), _textured_box([3, 0, 0])])
+
+    assert isinstance(merged.visual, trimesh.visual.TextureVisuals)
+    assert merged.visual.uv is not None
+    assert len(merged.visual.uv) == len(merged.vertices)
+    assert len(merged.vertices) == 16
+
+
+def test_merge_meshes_dedupe_welds_shared_vertices():
+    """adjacent boxes share a wall; dedupe collapses it, uvs follow"""
+    merged = merge_meshes(
+        [_textured_box([0, 0, 0]), _textured_box([1, 0, 0])], dedupe=True
+    )
+
+    assert len(merged.vertices) == 12
+    assert len(merged.faces) == 24
+    assert len(merged.visual.uv) == len(merged.vertices)
+
+
+def test_optimize_mesh_short_circuits_clean_meshes():
+    mesh = trimesh.creation.box()
+
+    # explicit caller guarantee
+    assert optimize_mesh(mesh, already_clean=True) is mesh
+
+    # upstream metadata flag (set by TerrainGenerator)
+    mesh.metadata['is_deduped'] = True
+    assert optimize_mesh(mesh) is mesh
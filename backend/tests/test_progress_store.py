@@ -0,0 +1,112 @@
+import time
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.main import InMemoryProgressStore, RedisProgressStore
+
+
+def test_in_memory_store_roundtrip_and_miss():
+    store = InMemoryProgressStore()
+
+    store["job-1"] = {"percent": 50, "message": "working"}
+    assert "job-1" in store
+    assert store["job-1"]["percent"] == 50
+    assert store.get("job-1")["message"] == "working"
+
+    assert "missing" not in store
+    assert store.get("missing") is None
+    with pytest.raises(KeyError):
+        store["missing"]
+
+
+def test_in_memory_store_expires_entries():
+    store = InMemoryProgressStore()
+    store["job-1"] = {"percent": 100}
+
+    # rewind the deadline instead of sleeping through the real TTL
+    deadline, progress = store._store["job-1"]
+    store._store["job-1"] = (time.monotonic() - 1, progress)
+
+    assert store.get("job-1") is None
+    assert "job-1" not in store
+    # lazy expiry also removes the underlying entry
+    assert "job-1" not in store._store
+
+
+def test_in_memory_store_evicts_oldest_at_cap(monkeypatch):
+    monkeypatch.setattr(InMemoryProgressStore, "MAX_ENTRIES", 3)
+    store = InMemoryProgressStore()
+
+    for i in range(3):
+        store[f"job-{i}"] = {"percent": i}
+    # updating an existing job moves it to the young end of the order
+    store["job-0"] = {"percent": 99}
+
+    # inserting past the cap evicts the oldest entry (job-1, not job-0)
+    store["job-3"] = {"percent": 3}
+
+    assert "job-1" not in store
+    assert store["job-0"]["percent"] == 99
+    assert "job-2" in store
+    assert "job-3" in store
+
+
+class _FakeRedis:
+    """minimal stand-in for the redis client: hashes plus pipeline"""
+
+    def __init__(self):
+        self.hashes = {}
+
+    def exists(self, key):
+        return key in self.hashes
+
+    def hgetall(self, key):
+        # redis returns strings; mirror that so percent coercion is real
+        return {k: str(v) for k, v in self.hashes.get(key, {}).items()}
+
+    def pipeline(self):
+        return _FakePipeline(self)
+
+
+class _FakePipeline:
+    def __init__(self, client):
+        self._client = client
+        self._ops = []
+
+    def delete(self, key):
+        self._ops.append(lambda: self._client.hashes.pop(key, None))
+
+    def hset(self, key, mapping):
+        self._ops.append(lambda: self._client.hashes.setdefault(key, {}).update(mapping))
+
+    def expire(self, key, ttl):
+        self._ops.append(lambda: None)
+
+    def execute(self):
+        for op in self._ops:
+            op()
+
+
+def test_redis_store_dict_semantics():
+    store = RedisProgressStore.__new__(RedisProgressStore)
+    store._redis = _FakeRedis()
+
+    store["job-1"] = {"percent": 50, "message": "working"}
+    assert "job-1" in store
+    # percent comes back from redis as a string and must be re-coerced
+    assert store["job-1"]["percent"] == 50
+    assert store["job-1"]["message"] == "working"
+
+    # assignment fully replaces the hash, matching dict semantics
+    store["job-1"] = {"percent": 100}
+    assert "message" not in store["job-1"]
+
+    assert store.get("missing") is None
+    assert "missing" not in store
+    with pytest.raises(KeyError):
+        store["missing"]